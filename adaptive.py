@@ -0,0 +1,83 @@
+from typing import Iterator
+
+import pulp
+
+from core import Alphabet, Vector, count_chars, get_residual, spell_chars
+from model import WarmStartHiGHS, build_alphabet_problem, get_counts
+
+
+def estimate_counts(prefix: str, alphabet: Alphabet, iterations: int = 20) -> Vector:
+    """
+    Iterates "spell the counts, recount" starting from the prefix
+    and averages the iterates, which smooths over the cycles the map falls into.
+    """
+    counts = {letter: 0 for letter in alphabet}
+    totals = {letter: 0 for letter in alphabet}
+    for _ in range(iterations):
+        spelled = count_chars(prefix + spell_chars(counts))
+        counts = {letter: spelled.get(letter, 0) for letter in alphabet}
+        for letter, count in counts.items():
+            totals[letter] += count
+    return {letter: round(total / iterations) for letter, total in totals.items()}
+
+
+def get_solver(solver: str, warm_start: bool, time_limit: float | None):
+    if solver == "SCIP_PY":
+        return pulp.SCIP_PY(msg=False, warmStart=warm_start, timeLimit=time_limit)
+    return WarmStartHiGHS(msg=False, warmStart=warm_start, timeLimit=time_limit)
+
+
+def solve_adaptive(
+    prefix: str,
+    alphabet: Alphabet,
+    radius: int = 3,
+    expansion: int = 3,
+    max_rounds: int = 20,
+    time_limit: float | None = None,
+    solver: str = "HiGHS",
+) -> Iterator[tuple[int, Vector, dict[str, int], dict[str, int]]]:
+    """
+    Instead of guessing a bound_delta for every letter,
+    each letter starts with a window of radius around its estimate.
+    After each solve only letters whose picked count sits on an edge of their window
+    get that edge moved out by expansion, and the previous counts warm start the next solve.
+    Yields (residual, counts, lower_bounds, upper_bounds) after every round
+    and stops once no picked count touches an edge.
+    """
+    estimate = estimate_counts(prefix, alphabet)
+    lower_bounds = {letter: max(0, count - radius) for letter, count in estimate.items()}
+    upper_bounds = {letter: count + radius for letter, count in estimate.items()}
+    counts: Vector = {}
+
+    for _ in range(max_rounds):
+        problem, variables = build_alphabet_problem(
+            prefix, alphabet, lower_bounds, upper_bounds, name="Adaptive_alphabet"
+        )
+        for letter, choices in variables.items():
+            for variable, count in choices.items():
+                if letter in counts:
+                    variable.setInitialValue(1 if count == counts[letter] else 0)
+
+        problem.solve(
+            solver=get_solver(solver, warm_start=len(counts) > 0, time_limit=time_limit)
+        )
+        counts = get_counts(variables)
+        yield (get_residual(prefix, counts), counts, lower_bounds, upper_bounds)
+
+        at_lower = [
+            letter
+            for letter, count in counts.items()
+            if count == lower_bounds[letter] and count > 0
+        ]
+        at_upper = [
+            letter for letter, count in counts.items() if count == upper_bounds[letter]
+        ]
+        if len(at_lower) == 0 and len(at_upper) == 0:
+            return
+
+        lower_bounds = lower_bounds | {
+            letter: max(0, lower_bounds[letter] - expansion) for letter in at_lower
+        }
+        upper_bounds = upper_bounds | {
+            letter: upper_bounds[letter] + expansion for letter in at_upper
+        }
@@ -0,0 +1,99 @@
+import time
+
+import highspy
+import pulp
+from main import get_alphabet, get_bounds, build_alphabet_problem
+
+
+def solve_with_stats(problem: pulp.LpProblem, time_limit: float) -> dict:
+    """
+    Solves problem with HiGHS and records the bounds
+    at the end of the root node alongside the final node count.
+    """
+    callback_types = highspy.cb.HighsCallbackType
+    stats = {"root_primal": None, "root_dual": None, "nodes": 0}
+
+    def callback(callback_type, message, data_out, data_in, user_data):
+        if data_out.mip_node_count == 0:
+            stats["root_primal"] = data_out.mip_primal_bound
+            stats["root_dual"] = data_out.mip_dual_bound
+        stats["nodes"] = data_out.mip_node_count
+
+    start = time.monotonic()
+    problem.solve(
+        solver=pulp.HiGHS(
+            msg=False,
+            timeLimit=time_limit,
+            callbackTuple=(callback, None),
+            callbacksToActivate=[callback_types.kCallbackMipInterrupt],
+        )
+    )
+    stats["time"] = time.monotonic() - start
+    stats["nodes"] = problem.solverModel.getInfo().mip_node_count
+    stats["objective"] = pulp.value(problem.objective)
+    stats["status"] = pulp.LpStatus[problem.status]
+    return stats
+
+
+def get_lp_bound(problem: pulp.LpProblem) -> float:
+    problem.solve(solver=pulp.HiGHS(msg=False, mip=False))
+    return pulp.value(problem.objective)
+
+
+def benchmark_cuts():
+    """
+    Compares the alphabet model with and without the structural cuts
+    on the bound of its linear relaxation, the gap after the root node
+    and the number of branch and bound nodes.
+    """
+    instances = [
+        ("This text contains the following letters:\n", 10),
+        ("This text contains the following letters:\n", 20),
+        ("Edwin would you believe it? This text has ", 8),
+        ("Edwin would you believe it? This text has ", 20),
+    ]
+    time_limit = 300
+
+    for prefix, bound_delta in instances:
+        alphabet = get_alphabet(prefix)
+        lower_bounds, upper_bounds = get_bounds(prefix, alphabet, bound_delta)
+        print(f"{prefix!r} with bound_delta={bound_delta}:")
+        for cuts in [False, True]:
+            problem, _ = build_alphabet_problem(
+                prefix, alphabet, lower_bounds, upper_bounds, cuts=cuts
+            )
+            lp_bound = get_lp_bound(problem)
+            stats = solve_with_stats(problem, time_limit)
+            root_gap = (stats["root_primal"] - stats["root_dual"]) / stats["root_primal"]
+            print(
+                f"\tcuts={cuts!s:<5}"
+                f" lp bound {lp_bound:6.1f},"
+                f" root gap {root_gap:6.1%},"
+                f" {stats['nodes']:7} nodes,"
+                f" objective {stats['objective']:5.0f} ({stats['status']})"
+                f" in {stats['time']:6.1f}s"
+            )
+
+
+benchmark_cuts()
+
+"""
+Produces after about a minute:
+---
+'This text contains the following letters:\n' with bound_delta=10:
+	cuts=False lp bound   63.5, root gap   1.5%,       1 nodes, objective    68 (Optimal) in    1.3s
+	cuts=True  lp bound   64.5, root gap   1.5%,       1 nodes, objective    68 (Optimal) in    0.9s
+'This text contains the following letters:\n' with bound_delta=20:
+	cuts=False lp bound    8.1, root gap  26.8%,     287 nodes, objective    23 (Optimal) in   11.7s
+	cuts=True  lp bound   10.9, root gap  25.6%,     213 nodes, objective    23 (Optimal) in   15.1s
+'Edwin would you believe it? This text has ' with bound_delta=8:
+	cuts=False lp bound   83.8, root gap   0.3%,       1 nodes, objective    87 (Optimal) in    0.4s
+	cuts=True  lp bound   85.9, root gap   0.2%,       1 nodes, objective    87 (Optimal) in    0.9s
+'Edwin would you believe it? This text has ' with bound_delta=20:
+	cuts=False lp bound   16.9, root gap  24.0%,     225 nodes, objective    30 (Optimal) in   10.9s
+	cuts=True  lp bound   19.5, root gap  26.1%,     437 nodes, objective    30 (Optimal) in   22.1s
+
+The cuts consistently lift the bound of the linear relaxation,
+but HiGHS' own root cuts close most of that difference anyway,
+so node counts and times go either way.
+"""
@@ -0,0 +1,57 @@
+import subprocess
+import sys
+import time
+
+
+def measure_import(statement: str, repeats: int = 10) -> float:
+    """
+    Measures the cold start of a fresh interpreter running statement.
+    We take the fastest of several runs to hide noise from the machine.
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def benchmark_startup():
+    """
+    A verification worker only needs core.
+    Importing main must not drag pulp in, so its cold start should stay
+    close to that of the bare interpreter.
+    """
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, main; assert 'pulp' not in sys.modules, 'main imports pulp'",
+        ],
+        check=True,
+    )
+
+    statements = {
+        "bare interpreter": "pass",
+        "import core": "import core",
+        "import main": "import main",
+        "import known": "import known",
+        "import model": "import model",
+    }
+    baseline = measure_import(statements["bare interpreter"])
+    for name, statement in statements.items():
+        took = measure_import(statement)
+        print(f"{name:>16}: {took * 1000:7.1f}ms (+{(took - baseline) * 1000:.1f}ms)")
+
+
+benchmark_startup()
+
+"""
+Produces something like this:
+---
+bare interpreter:    18.5ms (+-1.2ms)
+     import core:    25.6ms (+6.0ms)
+     import main:    26.5ms (+6.8ms)
+    import known:    24.8ms (+5.1ms)
+    import model:   292.1ms (+272.5ms)
+"""
@@ -0,0 +1,186 @@
+type Vector = dict[str, int]
+type Alphabet = list[str]
+
+single_digit = [
+    "",
+    "one",
+    "two",
+    "three",
+    "four",
+    "five",
+    "six",
+    "seven",
+    "eight",
+    "nine",
+]
+double_digit = [
+    "ten",
+    "eleven",
+    "twelve",
+    "thirteen",
+    "fourteen",
+    "fifteen",
+    "sixteen",
+    "seventeen",
+    "eighteen",
+    "nineteen",
+]
+below_hundred = [
+    "twenty",
+    "thirty",
+    "forty",
+    "fifty",
+    "sixty",
+    "seventy",
+    "eighty",
+    "ninety",
+]
+
+hundred = "hundred"
+thousand = "thousand"
+million = "million"
+billion = "billion"
+dash = "-"
+default_joiner = " and "
+
+
+def spell_number(n: int) -> str:
+    if n <= 0:
+        return ""
+    if n < 10:
+        return single_digit[n]
+    if n < 20:
+        return double_digit[n - 10]
+    if n < 100:
+        below, recurse = below_hundred[(n - (n % 10)) // 10 - 2], spell_number(n % 10)
+        if len(recurse) == 0:
+            return below
+        return f"{below}{dash}{recurse}"
+    if n < 1_000:
+        return f"{single_digit[n // 100]} {hundred} {spell_number(n % 100)}"
+    if n < 1_000_000:
+        return f"{spell_number(n // 1_000)} {thousand} {spell_number(n % 1_000)}"
+    if n < 1_000_000_000:
+        return f"{spell_number(n // 1_000_000)} {million} {spell_number(n % 1_000_000)}"
+    return f"{spell_number(n // 1_000_000_000)} {billion} ${spell_number(n % 1_000_000_000)}"
+
+
+def spell_char(c: str, n: int) -> str:
+    if n == 0:
+        return ""
+    return f"{spell_number(n).strip()} ❛{c}❜s"
+
+
+def spell_chars(chars: Vector, joiner: str = default_joiner) -> str:
+    spelled = [spell_char(c, n) for c, n in chars.items() if n > 0]
+    [*parts, last] = spelled if len(spelled) > 0 else [""]
+    return f"{", ".join(parts)}{joiner}{last}"
+
+
+def get_alphabet(prefix: str) -> Alphabet:
+    letters = "".join(single_digit + double_digit + below_hundred)
+    letters += dash + hundred + thousand + million + billion
+    letters += spell_char("a", 1) + spell_chars({})
+    letters += prefix
+    letters += ','
+    letters = "".join(letters.split())
+    return sorted(list(set(letters)))
+
+
+def count_chars(s: str) -> Vector:
+    return {c: s.count(c) for c in set("".join(s.split()))}
+
+
+def get_bounds(
+    prefix: str, alphabet: Alphabet, bound_delta: int
+) -> (dict[str, int], dict[str, int]):
+    lower_bounds: dict[str, int] = {letter: 0 for letter in alphabet} | count_chars(
+        prefix
+    )
+    upper_bounds: dict[str, int] = {
+        letter: count + bound_delta for letter, count in lower_bounds.items()
+    }
+    return (lower_bounds, upper_bounds)
+
+
+def vector_eq(a: Vector, b: Vector) -> bool:
+    """
+    Vectors are equal if they agree on every letter,
+    where letters missing from a vector count as 0.
+    """
+    letters = set(a.keys()) | set(b.keys())
+    return all(a.get(letter, 0) == b.get(letter, 0) for letter in letters)
+
+
+def spell_output(chars: Vector) -> str:
+    """
+    Spells a vector in the palindromic format of known.known_text.
+    The second half mirrors the first half line by line.
+    """
+    first_half = "\n".join(
+        [
+            "*",
+            "Write",
+            f"down {spell_chars(chars)}, in a",
+            "palindromic sequence",
+            "whose second",
+            "half runs",
+            "thus:",
+        ]
+    )
+    second_half = "\n".join(line[::-1] for line in reversed(first_half.split("\n")))
+    return f"{first_half}\n{second_half}"
+
+
+def get_fixed_counts(prefix: str, joiner: str = default_joiner) -> Vector:
+    """
+    Counts the letters of the output that don't depend on the chosen counts:
+    The prefix and the joiner in front of the last entry of spell_chars.
+    """
+    return count_chars(prefix + spell_chars({}, joiner))
+
+
+def get_contributions(
+    alphabet: Alphabet, lower_bounds: dict[str, int], upper_bounds: dict[str, int]
+) -> dict[str, dict[int, Vector]]:
+    """
+    For each letter and each count in its window,
+    the letters that spelling this count adds to the output.
+    """
+    return {
+        letter: {
+            count: count_chars(spell_char(letter, count))
+            for count in range(lower_bounds[letter], upper_bounds[letter] + 1)
+        }
+        for letter in alphabet
+    }
+
+
+def get_count_differences(
+    prefix: str, counts: Vector, joiner: str = default_joiner
+) -> Vector:
+    """
+    Count differences (expected - actual) of the text spelled from counts.
+    An autogram has only 0 differences.
+    """
+    actual_counts = count_chars(f"{prefix}{spell_chars(counts, joiner)}")
+    letters = set(counts.keys()) | set(actual_counts.keys())
+    return {
+        letter: counts.get(letter, 0) - actual_counts.get(letter, 0)
+        for letter in sorted(letters)
+    }
+
+
+def get_residual(prefix: str, counts: Vector, joiner: str = default_joiner) -> int:
+    """
+    The manhattan distance between counts and the counts of their spelling.
+    """
+    differences = get_count_differences(prefix, counts, joiner)
+    return sum(abs(difference) for difference in differences.values())
+
+
+def add_fillers(prefix: str, fillers: list[str]) -> str:
+    """
+    The prefix followed by the fillers, where prefix ends in whitespace.
+    """
+    return prefix + "".join(f"{filler} " for filler in fillers)
@@ -0,0 +1,229 @@
+"""
+Explores the map "spell the counts, recount":
+    counts -> count_chars(prefix + spell_chars(counts))
+Autograms are its fixed points. Every other seed eventually falls into a cycle.
+
+Trajectories are walked in numpy batches with Brent's cycle detection.
+All states ever seen are recorded in a bitset indexed by their hash,
+which lives in shared memory so that workers never re-walk
+a trajectory that some worker walked before.
+A hash collision only cuts a trajectory short, it never invents an attractor.
+"""
+
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from core import Alphabet, get_bounds
+from tables import get_multipliers, get_window_tables, hash_rows
+
+# No text spelled from counts below max_count gets anywhere close to
+# max_count letters, so the map never leaves [0, max_count).
+max_count = 1000
+default_bits = 1 << 30
+
+
+def get_tables(prefix: str, alphabet: Alphabet) -> (np.ndarray, np.ndarray):
+    """
+    fixed[j] counts alphabet[j] in the parts of the text that don't depend on counts.
+    table[i, n, j] is how many alphabet[j] spelling n alphabet[i]s adds.
+    """
+    fixed, tables = get_window_tables(
+        prefix,
+        alphabet,
+        {letter: 0 for letter in alphabet},
+        {letter: max_count - 1 for letter in alphabet},
+    )
+    return (fixed, np.stack(tables).astype(np.int16))
+
+
+class Explorer:
+    def __init__(self, prefix: str, alphabet: Alphabet, visited_name: str, bits: int):
+        self.prefix = prefix
+        self.alphabet = alphabet
+        self.fixed, self.table = get_tables(prefix, alphabet)
+        self.letter_indices = np.arange(len(alphabet))
+        self.comma = alphabet.index(",") if "," in alphabet else None
+        self.multipliers = get_multipliers(len(alphabet))
+        self.memory = shared_memory.SharedMemory(name=visited_name)
+        self.visited = np.ndarray((bits // 8,), dtype=np.uint8, buffer=self.memory.buf)
+        self.mask = np.uint64(bits - 1)
+        self.cycles: dict[tuple, tuple] = {}
+
+    def step(self, counts: np.ndarray) -> np.ndarray:
+        """
+        Spells and recounts a batch of count vectors at once.
+        """
+        spelled = self.table[self.letter_indices, counts].sum(axis=1) + self.fixed
+        if self.comma is not None:
+            separators = np.maximum((counts > 0).sum(axis=1) - 2, 0)
+            spelled[:, self.comma] += separators
+        return np.minimum(spelled, max_count - 1)
+
+    def hash(self, counts: np.ndarray) -> np.ndarray:
+        return hash_rows(counts, self.multipliers) & self.mask
+
+    def is_visited(self, hashes: np.ndarray) -> np.ndarray:
+        bytes_ = self.visited[hashes >> np.uint64(3)]
+        return (bytes_ >> (hashes & np.uint64(7)).astype(np.uint8)) & 1 == 1
+
+    def mark_visited(self, hashes: np.ndarray) -> None:
+        np.bitwise_or.at(
+            self.visited,
+            hashes >> np.uint64(3),
+            np.left_shift(1, hashes & np.uint64(7)).astype(np.uint8),
+        )
+
+    def get_cycle(self, state: np.ndarray, length: int) -> tuple:
+        """
+        The states of a cycle, rotated to start at its smallest state.
+        Cycles are remembered by each of their states,
+        so every cycle is only walked once.
+        """
+        key = tuple(int(count) for count in state)
+        if key not in self.cycles:
+            states = [state]
+            for _ in range(length - 1):
+                states.append(self.step(states[-1][None, :])[0])
+            states = [tuple(int(count) for count in state) for state in states]
+            start = states.index(min(states))
+            cycle = tuple(states[start:] + states[:start])
+            for state in states:
+                self.cycles[state] = cycle
+        return self.cycles[key]
+
+    def explore(self, seeds: np.ndarray) -> (dict[tuple, int], int):
+        """
+        Walks all seeds with Brent's cycle detection.
+        Returns how many trajectories detected each cycle themselves,
+        and how many seeds ran into a state that was already visited
+        or met another trajectory of the batch.
+        Merged seeds end in one of the cycles found, but aren't credited to it,
+        so discoveries say little about the size of a cycle's basin.
+        """
+        seed_hashes = self.hash(seeds)
+        fresh = ~self.is_visited(seed_hashes)
+        merged = int((~fresh).sum())
+        seen = [seed_hashes[fresh]]
+
+        tortoise = seeds[fresh]
+        hare = self.step(tortoise)
+        power = np.ones(len(tortoise), dtype=np.int64)
+        length = np.ones(len(tortoise), dtype=np.int64)
+        discoveries: dict[tuple, int] = {}
+
+        while len(hare) > 0:
+            hare_hashes = self.hash(hare)
+            seen.append(hare_hashes)
+            found = (tortoise == hare).all(axis=1)
+            for state, cycle_length in zip(hare[found], length[found]):
+                cycle = self.get_cycle(state, int(cycle_length))
+                discoveries[cycle] = discoveries.get(cycle, 0) + 1
+
+            # Of several trajectories meeting in the same state only one walks on.
+            first = np.zeros(len(hare), dtype=bool)
+            first[np.unique(hare_hashes, return_index=True)[1]] = True
+            walking = ~found & first & ~self.is_visited(hare_hashes)
+            merged += int((~found & ~walking).sum())
+            tortoise, hare = tortoise[walking], hare[walking]
+            power, length = power[walking], length[walking]
+
+            restart = power == length
+            tortoise[restart] = hare[restart]
+            power[restart] *= 2
+            length[restart] = 0
+
+            hare = self.step(hare)
+            length += 1
+
+        self.mark_visited(np.concatenate(seen))
+        return (discoveries, merged)
+
+
+explorer: Explorer | None = None
+
+
+def init_worker(prefix: str, alphabet: Alphabet, visited_name: str, bits: int) -> None:
+    global explorer
+    explorer = Explorer(prefix, alphabet, visited_name, bits)
+
+
+def explore_random_batch(
+    arguments: (int, np.ndarray, np.ndarray, int)
+) -> (dict[tuple, int], int):
+    seed, low, high, batch_size = arguments
+    rng = np.random.default_rng(seed)
+    return explorer.explore(rng.integers(low, high + 1, size=(batch_size, len(low))))
+
+
+def explore_seed_batch(seeds: np.ndarray) -> (dict[tuple, int], int):
+    return explorer.explore(seeds)
+
+
+def explore(
+    prefix: str,
+    alphabet: Alphabet,
+    seeds: int | np.ndarray,
+    bound_delta: int = 50,
+    batch_size: int = 10_000,
+    workers: int | None = None,
+    bits: int = default_bits,
+    random_seed: int = 0,
+) -> (list[dict], int):
+    """
+    Runs the map from seeds, which is either a number of random seeds
+    drawn from the get_bounds windows, or an array of structured seeds,
+    one count vector over alphabet per row.
+    Reports every attractor found, shortest cycle first,
+    with the number of trajectories that discovered it,
+    alongside the number of seeds that merged into an explored trajectory.
+    An attractor of length 1 is a fixed point and thus an autogram.
+    """
+    memory = shared_memory.SharedMemory(create=True, size=bits // 8)
+    memory.buf[:] = bytes(bits // 8)
+    try:
+        with multiprocessing.get_context("spawn").Pool(
+            processes=workers,
+            initializer=init_worker,
+            initargs=(prefix, alphabet, memory.name, bits),
+        ) as pool:
+            if isinstance(seeds, int):
+                lower_bounds, upper_bounds = get_bounds(prefix, alphabet, bound_delta)
+                low = np.array([lower_bounds[letter] for letter in alphabet])
+                high = np.array([upper_bounds[letter] for letter in alphabet])
+                batches = [
+                    (random_seed + i, low, high, min(batch_size, seeds - start))
+                    for i, start in enumerate(range(0, seeds, batch_size))
+                ]
+                results = pool.imap_unordered(explore_random_batch, batches)
+            else:
+                batches = [
+                    seeds[start : start + batch_size]
+                    for start in range(0, len(seeds), batch_size)
+                ]
+                results = pool.imap_unordered(explore_seed_batch, batches)
+
+            attractors: dict[tuple, int] = {}
+            merged = 0
+            for batch_discoveries, batch_merged in results:
+                merged += batch_merged
+                for cycle, discoveries in batch_discoveries.items():
+                    attractors[cycle] = attractors.get(cycle, 0) + discoveries
+    finally:
+        memory.close()
+        memory.unlink()
+
+    report = [
+        {
+            "length": len(cycle),
+            "discoveries": discoveries,
+            "cycle": [
+                {letter: count for letter, count in zip(alphabet, state)}
+                for state in cycle
+            ],
+        }
+        for cycle, discoveries in attractors.items()
+    ]
+    report.sort(key=lambda attractor: attractor["length"])
+    return (report, merged)
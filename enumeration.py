@@ -0,0 +1,166 @@
+import time
+from typing import Callable, Iterator
+
+import highspy
+import pulp
+
+from core import Alphabet, Vector
+from model import build_alphabet_problem
+
+type Choices = dict[str, dict[pulp.LpVariable, int]]
+
+
+def read_counts(
+    variables: Choices, value_of: Callable[[pulp.LpVariable], float]
+) -> (Vector, list[pulp.LpVariable]):
+    """
+    Reads the picked counts of a solution alongside the binaries picking them.
+    """
+    counts: Vector = {}
+    picked: list[pulp.LpVariable] = []
+    for letter, choices in variables.items():
+        for variable, count in choices.items():
+            if round(value_of(variable)) == 1:
+                counts[letter] = count
+                picked.append(variable)
+    return (counts, picked)
+
+
+def get_remaining(deadline: float | None) -> float | None:
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def enumerate_with_highs(
+    problem: pulp.LpProblem, variables: Choices, deadline: float | None
+) -> Iterator[tuple[int, Vector]]:
+    """
+    HiGHS has no solution pool, so after each optimal solve we forbid
+    the picked binaries as a whole with a no-good cut:
+    sum(picked) <= len(picked) - 1
+    The highspy model is built once and only grows by these cuts.
+    """
+    solver = pulp.HiGHS(msg=False)
+    solver.createAndConfigureSolver(problem)
+    solver.buildSolverModel(problem)
+    highs = problem.solverModel
+
+    while True:
+        remaining = get_remaining(deadline)
+        if remaining is not None:
+            if remaining <= 0:
+                return
+            highs.setOptionValue("time_limit", remaining)
+
+        highs.run()
+        if highs.getModelStatus() != highspy.HighsModelStatus.kOptimal:
+            return
+
+        solution = highs.getSolution().col_value
+        counts, picked = read_counts(variables, lambda v: solution[v.index])
+        yield (round(highs.getObjectiveValue()), counts)
+
+        highs.addRow(
+            -highs.getInfinity(),
+            len(picked) - 1,
+            len(picked),
+            [variable.index for variable in picked],
+            [1.0] * len(picked),
+        )
+
+
+def enumerate_with_scip(
+    problem: pulp.LpProblem, variables: Choices, deadline: float | None
+) -> Iterator[tuple[int, Vector]]:
+    """
+    SCIP keeps every solution it came across in its solution pool.
+    All pooled solutions are feasible for the current model,
+    so none of them beats the optimum of the current solve,
+    and those that tie with it can be yielded without solving again.
+    Everything yielded is forbidden with a no-good cut before the next solve.
+    """
+    from pyscipopt import quicksum
+
+    solver = pulp.SCIP_PY(msg=False)
+    solver.buildSolverModel(problem)
+    scip = problem.solverModel
+    pool: dict[tuple, (int, Vector, list[pulp.LpVariable])] = {}
+    yielded: set[tuple] = set()
+
+    while True:
+        remaining = get_remaining(deadline)
+        if remaining is not None:
+            if remaining <= 0:
+                return
+            scip.setParam("limits/time", remaining)
+
+        scip.optimize()
+        if scip.getStatus() != "optimal":
+            return
+
+        optimum = round(scip.getObjVal())
+        for solution in scip.getSols():
+            counts, picked = read_counts(
+                variables, lambda v: scip.getSolVal(solution, v.solverVar)
+            )
+            key = tuple(sorted(counts.items()))
+            # Heuristic solutions need not have tight deltas,
+            # so the same counts may show up with a larger objective.
+            residual = round(scip.getSolObjVal(solution))
+            if key not in yielded and residual < pool.get(key, (residual + 1,))[0]:
+                pool[key] = (residual, counts, picked)
+
+        ties = sorted(
+            key for key, (residual, _, _) in pool.items() if residual == optimum
+        )
+        if len(ties) == 0:
+            return
+
+        scip.freeTransform()
+        for key in ties:
+            residual, counts, picked = pool.pop(key)
+            yielded.add(key)
+            yield (residual, counts)
+            scip.addCons(
+                quicksum(variable.solverVar for variable in picked)
+                <= len(picked) - 1
+            )
+
+
+enumerators = {
+    "HiGHS": enumerate_with_highs,
+    "SCIP_PY": enumerate_with_scip,
+}
+
+
+def enumerate_solutions(
+    prefix: str,
+    alphabet: Alphabet,
+    lower_bounds: dict[str, int],
+    upper_bounds: dict[str, int],
+    max_solutions: int = 10,
+    max_residual: int | None = None,
+    time_limit: float | None = None,
+    solver: str = "HiGHS",
+) -> Iterator[tuple[int, Vector]]:
+    """
+    Streams distinct (residual, counts) pairs of the alphabet model
+    ordered by their manhattan residual, autograms having a residual of 0.
+    Stops after max_solutions, once residuals exceed max_residual,
+    or when time_limit seconds have passed.
+    """
+    if max_solutions <= 0:
+        return
+    problem, variables = build_alphabet_problem(
+        prefix, alphabet, lower_bounds, upper_bounds, name="Enumerate_alphabet"
+    )
+    deadline = None if time_limit is None else time.monotonic() + time_limit
+
+    solutions = enumerators[solver](problem, variables, deadline)
+    for found, (residual, counts) in enumerate(solutions, start=1):
+        if max_residual is not None and residual > max_residual:
+            return
+        yield (residual, counts)
+        if found >= max_solutions:
+            return
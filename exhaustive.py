@@ -0,0 +1,101 @@
+import math
+
+import numpy as np
+
+from core import Alphabet, Vector
+from meet_in_the_middle import get_few_entry_counts, is_solution
+from tables import get_window_tables
+
+# Below this many combinations numpy checks them all
+# faster than pulp builds the model.
+default_max_combinations = 1 << 20
+
+
+def get_size(
+    alphabet: Alphabet, lower_bounds: dict[str, int], upper_bounds: dict[str, int]
+) -> int:
+    return math.prod(upper_bounds[letter] - lower_bounds[letter] + 1 for letter in alphabet)
+
+
+def solve_exhaustive(
+    prefix: str,
+    alphabet: Alphabet,
+    lower_bounds: dict[str, int],
+    upper_bounds: dict[str, int],
+) -> list[Vector]:
+    """
+    Checks every combination of counts within the windows at once:
+    axis i of the broadcasted arrays runs over the window of alphabet[i],
+    and the last axis over the letters the spelling adds to.
+    """
+    fixed, tables = get_window_tables(prefix, alphabet, lower_bounds, upper_bounds)
+    dimensions = len(alphabet)
+
+    def along(axis: int, values: np.ndarray) -> np.ndarray:
+        shape = [1] * dimensions + list(values.shape[1:])
+        shape[axis] = len(values)
+        return values.reshape(shape)
+
+    counts = [
+        along(i, np.arange(lower_bounds[letter], upper_bounds[letter] + 1))
+        for i, letter in enumerate(alphabet)
+    ]
+    spelled = fixed + sum(along(i, table) for i, table in enumerate(tables))
+    if "," in alphabet:
+        entries = sum((count > 0).astype(np.int64) for count in counts)
+        spelled[..., alphabet.index(",")] += np.maximum(entries - 2, 0)
+
+    residuals = sum(
+        np.abs(spelled[..., j] - count) for j, count in enumerate(counts)
+    )
+    return [
+        {letter: int(counts[i].flat[index[i]]) for i, letter in enumerate(alphabet)}
+        for index in zip(*np.nonzero(residuals == 0))
+    ]
+
+
+def find_autograms(
+    prefix: str,
+    alphabet: Alphabet,
+    lower_bounds: dict[str, int],
+    upper_bounds: dict[str, int],
+    max_combinations: int = default_max_combinations,
+    time_limit: float | None = None,
+    solver: str = "HiGHS",
+) -> list[Vector]:
+    """
+    Returns all counts within the windows that count their own spelling.
+    Small windows are checked exhaustively with solve_exhaustive,
+    larger ones are handed to the ILP, which only is complete
+    if it finishes within time_limit.
+    The ILP counts ',' as the number of non-0 entries minus two,
+    so when ',' is part of alphabet its answers with fewer entries are dropped
+    and those few counts are checked one by one, like solve_exhaustive does.
+    """
+    size = get_size(alphabet, lower_bounds, upper_bounds)
+    if size <= max_combinations:
+        return solve_exhaustive(prefix, alphabet, lower_bounds, upper_bounds)
+
+    from enumeration import enumerate_solutions
+
+    solutions = [
+        counts
+        for _, counts in enumerate_solutions(
+            prefix,
+            alphabet,
+            lower_bounds,
+            upper_bounds,
+            max_solutions=size,
+            max_residual=0,
+            time_limit=time_limit,
+            solver=solver,
+        )
+        if "," not in alphabet or sum(count > 0 for count in counts.values()) >= 2
+    ]
+    if "," in alphabet:
+        solutions.extend(
+            counts
+            for counts in get_few_entry_counts(alphabet, lower_bounds, upper_bounds)
+            if is_solution(prefix, alphabet, counts)
+        )
+    return solutions
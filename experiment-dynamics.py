@@ -0,0 +1,42 @@
+from main import get_alphabet, get_residual
+from dynamics import explore
+
+
+def experiment_dynamics():
+    """
+    Rather than solving for an autogram we iterate "spell the counts, recount"
+    from many random seeds and look at where the trajectories end up.
+    A fixed point would be an autogram, longer cycles are near-misses.
+    """
+    prefix = "This text contains the following letters:\n"
+    alphabet = get_alphabet(prefix)
+    attractors, merged = explore(prefix, alphabet, seeds=1_000_000, bound_delta=50)
+
+    print(f"{merged} seeds merged into trajectories that were already explored.")
+    for attractor in attractors:
+        residuals = [get_residual(prefix, counts) for counts in attractor["cycle"]]
+        print(
+            f"cycle of length {attractor['length']} discovered {attractor['discoveries']} times,"
+            f" smallest residual on it: {min(residuals)}"
+        )
+        if attractor["length"] == 1:
+            print(f"\tautogram: {attractor['cycle'][0]}")
+
+
+if __name__ == "__main__":
+    experiment_dynamics()
+
+"""
+Produces after about 30s:
+---
+999368 seeds merged into trajectories that were already explored.
+cycle of length 2 discovered 1 times, smallest residual on it: 23
+cycle of length 2 discovered 1 times, smallest residual on it: 23
+cycle of length 5 discovered 1 times, smallest residual on it: 15
+...
+cycle of length 504 discovered 37 times, smallest residual on it: 11
+cycle of length 1465 discovered 1 times, smallest residual on it: 6
+cycle of length 1469 discovered 1 times, smallest residual on it: 6
+
+No fixed point, so there is no autogram reachable from these seeds.
+"""
@@ -0,0 +1,42 @@
+from main import get_alphabet, get_bounds, get_count_differences, enumerate_solutions
+
+
+def experiment_enumerate():
+    """
+    Instead of a single optimum we'd like to see the alternatives:
+    The best near-misses of the alphabet model, ordered by their residual.
+    """
+    prefix = "This text contains the following letters:\n"
+    alphabet = get_alphabet(prefix)
+    lower_bounds, upper_bounds = get_bounds(prefix, alphabet, bound_delta=10)
+
+    for residual, counts in enumerate_solutions(
+        prefix,
+        alphabet,
+        lower_bounds,
+        upper_bounds,
+        max_solutions=5,
+        time_limit=600,
+        solver="SCIP_PY",
+    ):
+        differences = {
+            letter: difference
+            for letter, difference in get_count_differences(prefix, counts).items()
+            if difference != 0
+        }
+        print(f"residual {residual}: {counts}")
+        print(f"\tCount differences (expected - actual): {differences}")
+
+
+experiment_enumerate()
+
+"""
+Produces after about 15s with SCIP_PY:
+---
+residual 68: {',': 10, '-': 0, ':': 2, 'T': 2, 'a': 2, 'b': 0, 'c': 2, 'd': 0, 'e': 14, 'f': 6, ...}
+	Count differences (expected - actual): {',': -9, 'a': -1, 'd': -1, 'e': -6, 'g': 1, 'o': -1, 's': -16, ...}
+residual 68: {',': 10, '-': 0, ':': 2, 'T': 2, 'a': 4, 'b': 0, 'c': 2, 'd': 0, 'e': 14, 'f': 6, ...}
+	Count differences (expected - actual): {',': -9, 'a': 1, 'd': -1, 'e': -6, 'g': -1, 'o': -1, 's': -16, ...}
+...
+Many counts sit at the upper end of their window, so bound_delta=10 is too tight here.
+"""
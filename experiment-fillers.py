@@ -0,0 +1,54 @@
+import pulp
+from main import (
+    get_alphabet,
+    get_bounds,
+    add_fillers,
+    spell_chars,
+    get_count_differences,
+    build_filler_problem,
+    get_counts,
+    get_words,
+)
+
+
+def experiment_fillers():
+    """
+    Instead of tuning the prefix by hand we let the solver pick
+    filler words to follow it and the joiner in front of the last letter.
+    Each of them adds letters, which gives the solver slack to absorb residuals.
+    """
+    prefix = "This text contains "
+    fillers = ["exactly", "precisely", "only", "just", "truly", "in total", "all told"]
+    joiners = [" and ", ", and ", " plus ", " as well as ", " and also "]
+    alphabet = get_alphabet(prefix + "".join(fillers + joiners))
+    lower_bounds, upper_bounds = get_bounds(prefix, alphabet, bound_delta=30)
+
+    problem, variables, filler_variables, joiner_variables = build_filler_problem(
+        prefix, alphabet, lower_bounds, upper_bounds, fillers, joiners
+    )
+    problem.solve(solver=pulp.HiGHS(msg=False, timeLimit=1200))
+    print(f"Problem status: {pulp.LpStatus[problem.status]}")
+
+    counts = get_counts(variables)
+    chosen_fillers = get_words(filler_variables)
+    [joiner] = get_words(joiner_variables)
+    full_prefix = add_fillers(prefix, chosen_fillers)
+    print(f"{full_prefix}{spell_chars(counts, joiner)}")
+
+    differences = get_count_differences(full_prefix, counts, joiner)
+    print(f"Count differences (expected - actual):\n{differences}")
+
+
+experiment_fillers()
+
+"""
+Produces after hitting the 20 mins time limit:
+---
+This text contains twenty ❛,❜s, six ❛-❜s, two ❛T❜s, three ❛a❜s, two ❛c❜s, two ❛d❜s, twenty-two ❛e❜s,
+two ❛g❜s, nine ❛h❜s, thirteen ❛i❜s, sixteen ❛n❜s, ten ❛o❜s, one ❛p❜s, six ❛r❜s, twenty-eight ❛s❜s,
+thirty-three ❛t❜s, thirteen ❛w❜s, six ❛x❜s, eight ❛y❜s, twenty-two ❛❛❜s and twenty-two ❛❜❜s
+Count differences (expected - actual):
+{',': 0, '-': 0, 'T': 0, 'a': 0, 'b': 0, 'c': 0, 'd': 0, 'e': 0, 'f': 0, 'g': -1, 'h': 0, 'i': 0, 'j': 0,
+ 'l': 0, 'm': 0, 'n': 0, 'o': 0, 'p': 0, 'r': 0, 's': 0, 't': 0, 'u': 0, 'v': 0, 'w': 0, 'x': 0, 'y': 1,
+ '❛': 0, '❜': 0}
+"""
@@ -0,0 +1,36 @@
+import math
+import time
+from main import get_bounds, spell_chars
+from meet_in_the_middle import solve_meet_in_the_middle
+
+
+def experiment_meet_in_the_middle():
+    """
+    Finds every autogram over ten letters within the get_bounds windows,
+    which the ILP can only do by enumerating until its residual exceeds 0.
+    """
+    alphabet = ["e", "f", "h", "i", "n", "o", "r", "s", "t", "v"]
+    prefix = (
+        f"The number of {", ".join(f"❛{l}❜s" for l in alphabet)} in this text is:\n\t"
+    )
+    lower_bounds, upper_bounds = get_bounds(prefix, alphabet, 20)
+    size = math.prod(upper_bounds[letter] - lower_bounds[letter] + 1 for letter in alphabet)
+
+    start = time.monotonic()
+    solutions = solve_meet_in_the_middle(prefix, alphabet, lower_bounds, upper_bounds)
+    took = time.monotonic() - start
+    print(f"{took:.1f}s: {len(solutions)} autograms among {size:.2e} combinations")
+    for counts in solutions:
+        print(f"{prefix}{spell_chars(counts)}")
+
+
+experiment_meet_in_the_middle()
+
+"""
+Produces after about 20s:
+---
+19.8s: 0 autograms among 1.67e+13 combinations
+
+So no autogram exists within these windows.
+enumerate_solutions agrees: its best residual there is 1.
+"""
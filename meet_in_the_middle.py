@@ -0,0 +1,171 @@
+"""
+An exact search for counts that spell themselves, complete within the windows.
+
+The letters are split into two halves.
+For every combination of counts of a half we know the letters
+its spelled entries add to the whole text, so we also know
+what the other half has to add for the counts to be correct.
+Both halves are enumerated in chunks of at most max_rows combinations,
+and joined through a hash of exactly these requirements.
+"""
+
+import math
+from typing import Iterator
+
+import numpy as np
+
+from core import Alphabet, Vector, count_chars, spell_chars
+from tables import get_multipliers, get_window_tables, hash_rows
+
+default_max_rows = 1 << 21
+
+
+def is_solution(prefix: str, alphabet: Alphabet, counts: Vector) -> bool:
+    """
+    Counts are a solution if they count their own spelling on every letter of alphabet.
+    """
+    spelled = count_chars(prefix + spell_chars(counts))
+    return all(spelled.get(letter, 0) == counts[letter] for letter in alphabet)
+
+
+def get_few_entry_counts(
+    alphabet: Alphabet, lower_bounds: dict[str, int], upper_bounds: dict[str, int]
+) -> Iterator[Vector]:
+    """
+    Yields the counts within the windows with fewer than two non-0 entries.
+    """
+    zero = {letter: 0 for letter in alphabet}
+    at_zero = {letter for letter in alphabet if lower_bounds[letter] == 0}
+    if len(at_zero) == len(alphabet):
+        yield zero
+    for letter in alphabet:
+        if len(at_zero - {letter}) == len(alphabet) - 1:
+            for count in range(max(1, lower_bounds[letter]), upper_bounds[letter] + 1):
+                yield zero | {letter: count}
+
+
+def split_letters(sizes: list[int]) -> (list[int], list[int]):
+    """
+    Splits letter indices into two halves with similar numbers of combinations.
+    """
+    halves: (list[int], list[int]) = ([], [])
+    logs = [0.0, 0.0]
+    for i in sorted(range(len(sizes)), key=lambda i: -sizes[i]):
+        half = 0 if logs[0] <= logs[1] else 1
+        halves[half].append(i)
+        logs[half] += math.log(sizes[i])
+    return halves
+
+
+class Half:
+    def __init__(
+        self,
+        letters: list[int],
+        low: np.ndarray,
+        fixed: np.ndarray,
+        tables: list[np.ndarray],
+        comma: int | None,
+    ):
+        self.letters = letters
+        self.low = low[letters]
+        self.shape = tuple(len(tables[i]) for i in letters)
+        self.size = math.prod(self.shape)
+        self.fixed = fixed
+        self.tables = tables
+        self.comma = comma
+
+    def chunks(self, max_rows: int) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Yields (counts, provided, required) for chunks of combinations:
+        counts of the letters of this half,
+        what this half adds to each letter,
+        and what the other half needs to add to each letter of this half.
+        ',' is also counted by the number of non-0 entries minus two,
+        so each half adds its number of non-0 entries to it.
+        """
+        for start in range(0, self.size, max_rows):
+            indices = np.arange(start, min(start + max_rows, self.size))
+            # A half without letters has a single combination of no counts.
+            digits = np.unravel_index(indices, self.shape) if len(self.shape) > 0 else ()
+            counts = np.array(digits, dtype=np.int64).reshape(-1, len(indices)).T + self.low
+            provided = np.zeros((len(indices), len(self.fixed)), dtype=np.int64)
+            for letter, digit in zip(self.letters, digits):
+                provided += self.tables[letter][digit]
+            if self.comma is not None:
+                provided[:, self.comma] += (counts > 0).sum(axis=1)
+            required = counts - self.fixed[self.letters] - provided[:, self.letters]
+            if self.comma in self.letters:
+                required[:, self.letters.index(self.comma)] += 2
+            yield (counts, provided, required)
+
+
+def solve_meet_in_the_middle(
+    prefix: str,
+    alphabet: Alphabet,
+    lower_bounds: dict[str, int],
+    upper_bounds: dict[str, int],
+    max_rows: int = default_max_rows,
+) -> list[Vector]:
+    """
+    Finds all counts within the windows that count their own spelling
+    on every letter of alphabet.
+    The halves are enumerated max_rows combinations at a time,
+    so memory stays bounded while time grows with
+    the number of chunks of the smaller half times the size of the larger half.
+    The halves count ',' as the number of non-0 entries minus two,
+    which is only right for at least two entries,
+    so when ',' is part of alphabet the few counts with fewer entries
+    are checked one by one instead.
+    """
+    fixed, tables = get_window_tables(prefix, alphabet, lower_bounds, upper_bounds)
+    low = np.array([lower_bounds[letter] for letter in alphabet], dtype=np.int64)
+    comma = alphabet.index(",") if "," in alphabet else None
+    letters_a, letters_b = split_letters([len(table) for table in tables])
+    half_a = Half(letters_a, low, fixed, tables, comma)
+    half_b = Half(letters_b, low, fixed, tables, comma)
+    if half_a.size > half_b.size:
+        half_a, half_b = half_b, half_a
+
+    multipliers = get_multipliers(len(alphabet))
+    solutions: list[Vector] = []
+    if comma is not None:
+        solutions.extend(
+            counts
+            for counts in get_few_entry_counts(alphabet, lower_bounds, upper_bounds)
+            if is_solution(prefix, alphabet, counts)
+        )
+
+    for counts_a, provided_a, required_a in half_a.chunks(max_rows):
+        # Half a demands required_a from half b on its own letters
+        # and offers provided_a on the letters of half b.
+        keys_a = np.concatenate([required_a, provided_a[:, half_b.letters]], axis=1)
+        hashes_a = hash_rows(keys_a, multipliers)
+        order = np.argsort(hashes_a)
+        sorted_hashes = hashes_a[order]
+
+        for counts_b, provided_b, required_b in half_b.chunks(max_rows):
+            keys_b = np.concatenate([provided_b[:, half_a.letters], required_b], axis=1)
+            hashes_b = hash_rows(keys_b, multipliers)
+            left = np.searchsorted(sorted_hashes, hashes_b, side="left")
+            right = np.searchsorted(sorted_hashes, hashes_b, side="right")
+            matches = right - left
+            rows_b = np.repeat(np.arange(len(hashes_b)), matches)
+            if len(rows_b) == 0:
+                continue
+            offsets = np.arange(len(rows_b)) - np.repeat(np.cumsum(matches) - matches, matches)
+            rows_a = order[np.repeat(left, matches) + offsets]
+            equal = (keys_a[rows_a] == keys_b[rows_b]).all(axis=1)
+
+            for row_a, row_b in zip(rows_a[equal], rows_b[equal]):
+                combined = np.zeros(len(alphabet), dtype=np.int64)
+                combined[half_a.letters] = counts_a[row_a]
+                combined[half_b.letters] = counts_b[row_b]
+                counts = {
+                    letter: int(count) for letter, count in zip(alphabet, combined)
+                }
+                if comma is not None and np.count_nonzero(combined) < 2:
+                    continue
+                if is_solution(prefix, alphabet, counts):
+                    solutions.append(counts)
+
+    return solutions
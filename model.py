@@ -0,0 +1,376 @@
+import numpy as np
+import pulp
+
+from core import (
+    Alphabet,
+    Vector,
+    count_chars,
+    default_joiner,
+    get_contributions,
+)
+
+
+def implies(a: pulp.LpVariable, b: pulp.LpVariable) -> pulp.LpConstraint:
+    """
+    How do implications work in ILP?
+    a -> b
+
+    !a | b
+    1 1 1
+    1 0 0
+    0 1 1
+    0 0 1
+
+    a - b < 1
+    1 1 ( 0) 1
+    1 0 ( 1) 0
+    0 1 (-1) 1
+    0 0 ( 0) 1
+
+    a - b <= 0
+    """
+    return a - b <= 0
+
+
+def abs(
+    x: pulp.LpVariable, y: pulp.LpVariable
+) -> (pulp.LpVariable, list[pulp.LpConstraint]):
+    """
+    By introducing a help variable 'delta',
+    we can compute the absolute difference between two values.
+    The 'trick' is that we constrain the variable to be >= the linear parts of the absolute value.
+    Hence the result is a tuple of the new variable alongside the implied constraints.
+    """
+    delta = pulp.LpVariable(name=f"delta_({x})_({y})", lowBound=0, cat=pulp.LpInteger)
+
+    constraints = [
+        delta >= x - y,
+        delta >= -(x - y),
+    ]
+
+    return (delta, constraints)
+
+
+def manhattan(
+    xys: list[(pulp.LpVariable, pulp.LpVariable)]
+) -> (pulp.LpConstraint, list[pulp.LpConstraint]):
+    """
+    Construct a tuple of (optimization_goal, constraints) where:
+    - optimization_goal computes the manhattan distance of the tuples provided in xys.
+    - constraints is a list of additional problem constraints produced from helper variables.
+    """
+    deltas = []
+    constraints = []
+
+    for x, y in xys:
+        (delta, cs) = abs(x, y)
+        deltas.append(delta)
+        constraints += cs
+
+    return (sum(deltas), constraints)
+
+
+def get_letters_to_variables_to_counts(
+    alphabet: Alphabet, lower_bounds: dict[str, int], upper_bounds: dict[str, int]
+) -> dict[str, dict[pulp.LpVariable, int]]:
+    return {
+        letter: {
+            pulp.LpVariable(
+                name=f"{letter if letter != '-' else '_'}_{count}", cat=pulp.LpBinary
+            ): count
+            for count in range(lower_bounds[letter], upper_bounds[letter] + 1)
+        }
+        for letter in alphabet
+    }
+
+
+def get_offsets(
+    contributions: dict[str, dict[int, Vector]],
+    variables: dict[str, dict[pulp.LpVariable, int]],
+) -> dict[str, list[(int, pulp.LpVariable)]]:
+    """
+    For each letter the (count, variable) pairs of all choices that add to it.
+    """
+    offsets: dict[str, list[(int, pulp.LpVariable)]] = {
+        letter: [] for letter in variables
+    }
+
+    for letter, choices in variables.items():
+        for variable, count in choices.items():
+            for offset_letter, offset_count in contributions[letter][count].items():
+                if offset_letter in offsets:
+                    offsets[offset_letter].append((offset_count, variable))
+
+    return offsets
+
+
+def get_range(
+    expression: pulp.LpAffineExpression,
+    groups: list[list[pulp.LpVariable]],
+    free: list[pulp.LpVariable],
+) -> (int, int):
+    """
+    The smallest and largest value expression takes
+    when exactly one variable of each group and any of the free variables are 1.
+    """
+    low = high = expression.constant
+    for group in groups:
+        coefficients = [expression.get(variable, 0) for variable in group]
+        low += min(coefficients)
+        high += max(coefficients)
+    for variable in free:
+        low += min(0, expression.get(variable, 0))
+        high += max(0, expression.get(variable, 0))
+    return (low, high)
+
+
+def get_structural_cuts(
+    variables: dict[str, dict[pulp.LpVariable, int]],
+    groups: list[list[pulp.LpVariable]],
+    free: list[pulp.LpVariable],
+    implied: dict[str, pulp.LpAffineExpression],
+    deltas: dict[str, pulp.LpVariable],
+) -> list[(pulp.LpConstraint, str)]:
+    """
+    Cuts derived from how spell_chars builds the text.
+    implied[letter] is the count of letter in the spelled text
+    and deltas[letter] is its distance to the picked count.
+
+    Word length cuts:
+    The words of all other letters can only add so many of a letter,
+    so picking count n for it leaves at least the distance of n
+    to the range implied could take alongside n:
+        delta >= sum(distance(n) * letter_n)
+    The distances are convex in the picked count,
+    which the linear relaxation of |implied - picked| doesn't see.
+
+    Entry cuts:
+    Every non-0 entry adds at least (and for the quotes exactly) the same number
+    of some letters, e.g. one 's' and one of each quote per entry.
+    With entries the number of other non-0 letters
+    and rest what the letter's own entry, the prefix and the words add:
+        picked + delta >= min(rest) + least * entries
+        picked - delta <= max(rest) + most * entries
+    """
+    cuts = []
+    entry_variables = {
+        variable
+        for choices in variables.values()
+        for variable, count in choices.items()
+        if count != 0
+    }
+
+    for letter, choices in variables.items():
+        expression = implied[letter]
+        own = list(choices)
+        others = [group for group in groups if group is not choices]
+        low, high = get_range(expression, others, free)
+
+        distances = {}
+        for variable, count in choices.items():
+            own_low = low + expression.get(variable, 0)
+            own_high = high + expression.get(variable, 0)
+            distances[variable] = max(0, own_low - count, count - own_high)
+        if any(distance > 0 for distance in distances.values()):
+            cuts.append(
+                (
+                    deltas[letter]
+                    >= sum(distance * variable for variable, distance in distances.items()),
+                    f"Word length cut for {letter!r}",
+                )
+            )
+
+        other_entries = [
+            variable for variable in entry_variables if variable not in choices
+        ]
+        if len(other_entries) == 0:
+            continue
+        per_entry = [expression.get(variable, 0) for variable in other_entries]
+        least, most = min(per_entry), max(per_entry)
+        entries = sum(other_entries)
+        picked = sum(count * variable for variable, count in choices.items())
+        rest = pulp.LpAffineExpression(
+            {
+                variable: coefficient
+                for variable, coefficient in expression.items()
+                if variable not in entry_variables or variable in choices
+            },
+            constant=expression.constant,
+        )
+        rest_low, rest_high = get_range(rest, [own] + others, free)
+        if least > 0:
+            cuts.append(
+                (
+                    picked + deltas[letter] >= rest_low + least * entries,
+                    f"Entry lower cut for {letter!r}",
+                )
+            )
+        if least == most:
+            cuts.append(
+                (
+                    picked - deltas[letter] <= rest_high + most * entries,
+                    f"Entry upper cut for {letter!r}",
+                )
+            )
+
+    return cuts
+
+
+def build_alphabet_problem(
+    prefix: str,
+    alphabet: Alphabet,
+    lower_bounds: dict[str, int],
+    upper_bounds: dict[str, int],
+    name: str = "Alphabet",
+    cuts: bool = False,
+) -> (pulp.LpProblem, dict[str, dict[pulp.LpVariable, int]]):
+    """
+    The model of experiment-manhattan-alphabet-comma.py:
+    Every letter picks exactly one count from its window
+    and we minimize the manhattan distance between the picked counts
+    and the counts implied by the text spelled from them.
+    ',' additionally counts the separators between the spelled letters,
+    which is the number of non-0 letters minus two.
+    """
+    problem, variables, _, _ = build_filler_problem(
+        prefix, alphabet, lower_bounds, upper_bounds, [], [default_joiner], name, cuts
+    )
+    return (problem, variables)
+
+
+def build_filler_problem(
+    prefix: str,
+    alphabet: Alphabet,
+    lower_bounds: dict[str, int],
+    upper_bounds: dict[str, int],
+    fillers: list[str],
+    joiners: list[str],
+    name: str = "Filler",
+    cuts: bool = False,
+) -> (
+    pulp.LpProblem,
+    dict[str, dict[pulp.LpVariable, int]],
+    dict[pulp.LpVariable, str],
+    dict[pulp.LpVariable, str],
+):
+    """
+    Extends the alphabet model with words the solver may choose:
+    Any number of fillers may follow the prefix,
+    and exactly one of the joiners goes in front of the last spelled letter.
+    Their letters are added to the counts just like the spelled numbers.
+    The residual dominates the objective, among equal residuals fewer fillers win.
+    The order of the spelled letters doesn't change any count,
+    so it is free to pick after solving.
+    With cuts the structural cuts of get_structural_cuts are added.
+    """
+    variables = get_letters_to_variables_to_counts(alphabet, lower_bounds, upper_bounds)
+    contributions = get_contributions(alphabet, lower_bounds, upper_bounds)
+    offsets = get_offsets(contributions, variables)
+    prefix_counts = count_chars(prefix)
+
+    filler_variables = {
+        pulp.LpVariable(name=f"filler_{i}", cat=pulp.LpBinary): filler
+        for i, filler in enumerate(fillers)
+    }
+    joiner_variables = {
+        pulp.LpVariable(name=f"joiner_{i}", cat=pulp.LpBinary): joiner
+        for i, joiner in enumerate(joiners)
+    }
+    for variable, word in (filler_variables | joiner_variables).items():
+        for letter, count in count_chars(word).items():
+            if letter in offsets:
+                offsets[letter].append((count, variable))
+
+    problem = pulp.LpProblem(name=name, sense=pulp.LpMinimize)
+
+    implied: dict[str, pulp.LpAffineExpression] = {}
+    deltas: dict[str, pulp.LpVariable] = {}
+    for letter, choices in variables.items():
+        weighted_choice = sum(
+            [weight * variable for variable, weight in choices.items()]
+        )
+        offset_sum = sum([weight * variable for weight, variable in offsets[letter]])
+        if letter == ",":
+            non_zero_variables = [
+                variable
+                for choices in variables.values()
+                for variable, count in choices.items()
+                if count != 0
+            ]
+            offset_sum += sum(non_zero_variables) - 2
+
+        implied[letter] = (
+            pulp.LpAffineExpression(constant=prefix_counts.get(letter, 0)) + offset_sum
+        )
+        deltas[letter], delta_constraints = abs(implied[letter], weighted_choice)
+        for constraint in delta_constraints:
+            problem += constraint
+
+    problem += (len(fillers) + 1) * sum(deltas.values()) + sum(filler_variables)
+
+    if cuts:
+        groups = list(variables.values()) + [joiner_variables]
+        for cut, cut_name in get_structural_cuts(
+            variables, groups, list(filler_variables), implied, deltas
+        ):
+            problem += (cut, cut_name)
+
+    for letter, choices in variables.items():
+        problem += (
+            sum([variable for variable, _ in choices.items()]) == 1,
+            f"Pick exactly one {letter!r}",
+        )
+
+    problem += (sum(joiner_variables) == 1, "Pick exactly one joiner")
+
+    return (problem, variables, filler_variables, joiner_variables)
+
+
+def get_words(word_variables: dict[pulp.LpVariable, str]) -> list[str]:
+    """
+    Reads the picked fillers or joiners from a solved problem.
+    """
+    return [
+        word
+        for variable, word in word_variables.items()
+        if variable.varValue is not None and round(variable.varValue) == 1
+    ]
+
+
+def get_counts(variables: dict[str, dict[pulp.LpVariable, int]]) -> Vector:
+    """
+    Reads the picked count of every letter from a solved problem.
+    """
+    return {
+        letter: count
+        for letter, choices in variables.items()
+        for variable, count in choices.items()
+        if variable.varValue is not None and round(variable.varValue) == 1
+    }
+
+
+class WarmStartHiGHS(pulp.HiGHS):
+    """
+    pulp.HiGHS ignores initial values, so we hand them to highspy ourselves.
+    Variables without an initial value are left for HiGHS to complete.
+    """
+
+    def __init__(self, warmStart: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.warm_start = warmStart
+
+    def callSolver(self, lp: pulp.LpProblem):
+        if self.warm_start:
+            initial = [
+                (variable.index, variable.varValue)
+                for variable in lp.variables()
+                if variable.varValue is not None
+            ]
+            if len(initial) > 0:
+                indices, values = zip(*initial)
+                lp.solverModel.setSolution(
+                    len(indices),
+                    np.array(indices, dtype=np.int32),
+                    np.array(values, dtype=np.float64),
+                )
+        super().callSolver(lp)
@@ -0,0 +1,375 @@
+"""
+A local job service for autogram searches.
+
+Clients connect to a unix socket and talk newline delimited JSON:
+- {"op": "submit", "job": {...}} queues a search and streams its events.
+- {"op": "watch", "job_id": ...} streams the events of a known job.
+- {"op": "cancel", "job_id": ...} stops a queued or running job and acknowledges it.
+- {"op": "list"} lists all known jobs and their latest event.
+
+A job looks like {"prefix": ..., "alphabet": [...], "bound_delta": 10, "time_limit": 600}.
+Only "prefix" is required. An optional "owner" is used to share workers fairly:
+queued jobs are started round robin across owners.
+Identical jobs share one search, no matter who submitted them.
+So cancelling is global: it stops the search for everyone waiting on it.
+"""
+
+import argparse
+import asyncio
+import collections
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass, field
+
+from core import get_alphabet, get_bounds, get_residual
+
+
+default_socket = "/tmp/autogram-service.sock"
+final_events = {"done", "failed", "cancelled"}
+progress_interval = 1.0
+
+
+def normalize_job(job: dict) -> dict:
+    prefix = job["prefix"]
+    alphabet = job.get("alphabet") or get_alphabet(prefix)
+    time_limit = job.get("time_limit")
+    return {
+        "prefix": prefix,
+        "alphabet": sorted(set(alphabet)),
+        "bound_delta": int(job.get("bound_delta", 10)),
+        "time_limit": None if time_limit is None else float(time_limit),
+    }
+
+
+def finite(value: float) -> float | None:
+    """
+    HiGHS reports missing bounds as infinities, which JSON can't represent.
+    """
+    return value if math.isfinite(value) else None
+
+
+def get_job_id(job: dict) -> str:
+    canonical = json.dumps(job, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def run_search(job: dict, connection) -> None:
+    """
+    Runs in a worker process and sends events through connection.
+    pulp is imported here so that the service itself starts fast.
+    """
+    import highspy
+    import pulp
+
+    from enumeration import read_counts
+    from model import build_alphabet_problem, get_counts
+
+    prefix, alphabet = job["prefix"], job["alphabet"]
+    lower_bounds, upper_bounds = get_bounds(prefix, alphabet, job["bound_delta"])
+    problem, variables = build_alphabet_problem(
+        prefix, alphabet, lower_bounds, upper_bounds
+    )
+
+    callback_types = highspy.cb.HighsCallbackType
+    last_progress = [0.0]
+
+    def callback(callback_type, message, data_out, data_in, user_data):
+        if callback_type == callback_types.kCallbackMipImprovingSolution:
+            connection.send(
+                {
+                    "event": "incumbent",
+                    "residual": finite(data_out.objective_function_value),
+                    "bound": finite(data_out.mip_dual_bound),
+                    "gap": finite(data_out.mip_gap),
+                    "counts": read_counts(
+                        variables, lambda variable: data_out.mip_solution[variable.index]
+                    )[0],
+                }
+            )
+        elif callback_type == callback_types.kCallbackMipInterrupt:
+            now = time.monotonic()
+            if now - last_progress[0] >= progress_interval:
+                last_progress[0] = now
+                connection.send(
+                    {
+                        "event": "progress",
+                        "residual": finite(data_out.mip_primal_bound),
+                        "bound": finite(data_out.mip_dual_bound),
+                        "gap": finite(data_out.mip_gap),
+                        "nodes": data_out.mip_node_count,
+                        "running_time": data_out.running_time,
+                    }
+                )
+
+    problem.solve(
+        solver=pulp.HiGHS(
+            msg=False,
+            threads=1,
+            timeLimit=job["time_limit"],
+            callbackTuple=(callback, None),
+            callbacksToActivate=[
+                callback_types.kCallbackMipImprovingSolution,
+                callback_types.kCallbackMipInterrupt,
+            ],
+        )
+    )
+
+    counts = get_counts(variables)
+    connection.send(
+        {
+            "event": "done",
+            "status": pulp.LpStatus[problem.status],
+            "counts": counts,
+            "residual": get_residual(prefix, counts),
+        }
+    )
+    connection.close()
+
+
+@dataclass
+class Job:
+    job_id: str
+    job: dict
+    owner: str
+    latest: dict[str, dict] = field(default_factory=dict)
+    subscribers: set[asyncio.Queue] = field(default_factory=set)
+    task: asyncio.Task | None = None
+
+    @property
+    def finished(self) -> bool:
+        return any(event in final_events for event in self.latest)
+
+    def publish(self, event: dict) -> None:
+        """
+        Only the latest event of each kind is kept,
+        which is all a late subscriber needs to catch up.
+        """
+        event = {"job_id": self.job_id} | event
+        self.latest.pop(event["event"], None)
+        self.latest[event["event"]] = event
+        for queue in self.subscribers:
+            queue.put_nowait(event)
+
+
+class JobService:
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.running = 0
+        self.jobs: dict[str, Job] = {}
+        self.pending: dict[str, collections.deque[Job]] = {}
+        self.context = multiprocessing.get_context("spawn")
+
+    def submit(self, job: dict) -> (Job, bool):
+        if not isinstance(job, dict):
+            raise TypeError(f"job must be an object, not {job!r}")
+        owner = str(job.get("owner", "anonymous"))
+        job = normalize_job(job)
+        job_id = get_job_id(job)
+        if job_id in self.jobs:
+            return (self.jobs[job_id], True)
+
+        queued = Job(job_id=job_id, job=job, owner=owner)
+        self.jobs[job_id] = queued
+        self.pending.setdefault(owner, collections.deque()).append(queued)
+        queued.publish({"event": "queued", "job": job})
+        self.dispatch()
+        return (queued, False)
+
+    def dispatch(self) -> None:
+        """
+        Starts queued jobs while workers are free,
+        taking one job per owner in turn.
+        """
+        while self.running < self.workers and len(self.pending) > 0:
+            owner, queue = next(iter(self.pending.items()))
+            job = queue.popleft()
+            del self.pending[owner]
+            if len(queue) > 0:
+                self.pending[owner] = queue
+            self.running += 1
+            job.task = asyncio.create_task(self.run(job))
+            job.task.add_done_callback(self.release)
+
+    def release(self, task: asyncio.Task) -> None:
+        """
+        Frees the worker of a finished task.
+        This also runs for tasks cancelled before they ever started.
+        """
+        self.running -= 1
+        self.dispatch()
+
+    async def run(self, job: Job) -> None:
+        loop = asyncio.get_running_loop()
+        receiver, sender = self.context.Pipe(duplex=False)
+        process = self.context.Process(
+            target=run_search, args=(job.job, sender), daemon=True
+        )
+        process.start()
+        sender.close()
+        job.publish({"event": "started", "pid": process.pid})
+
+        closed = loop.create_future()
+
+        def on_readable():
+            try:
+                job.publish(receiver.recv())
+            except (EOFError, OSError):
+                loop.remove_reader(receiver.fileno())
+                if not closed.done():
+                    closed.set_result(None)
+
+        loop.add_reader(receiver.fileno(), on_readable)
+        try:
+            await closed
+        except asyncio.CancelledError:
+            loop.remove_reader(receiver.fileno())
+            process.terminate()
+            raise
+        finally:
+            receiver.close()
+            await asyncio.to_thread(process.join)
+
+        if not job.finished:
+            job.publish({"event": "failed", "exitcode": process.exitcode})
+            del self.jobs[job.job_id]
+
+    def cancel(self, job_id: str) -> bool:
+        job = self.jobs.get(job_id)
+        if job is None or job.finished:
+            return False
+
+        if job.task is None:
+            queue = self.pending[job.owner]
+            queue.remove(job)
+            if len(queue) == 0:
+                del self.pending[job.owner]
+        else:
+            job.task.cancel()
+
+        job.publish({"event": "cancelled"})
+        del self.jobs[job_id]
+        return True
+
+    async def stream(self, job: Job, writer: asyncio.StreamWriter) -> None:
+        queue: asyncio.Queue = asyncio.Queue()
+        for event in job.latest.values():
+            queue.put_nowait(event)
+        job.subscribers.add(queue)
+        try:
+            while True:
+                event = await queue.get()
+                await send(writer, event)
+                if event["event"] in final_events:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            job.subscribers.discard(queue)
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        streams: set[asyncio.Task] = set()
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    op = request["op"]
+                    if op == "submit":
+                        job, deduplicated = self.submit(request["job"])
+                        await send(
+                            writer,
+                            {
+                                "event": "accepted",
+                                "job_id": job.job_id,
+                                "deduplicated": deduplicated,
+                            },
+                        )
+                        streams.add(asyncio.create_task(self.stream(job, writer)))
+                    elif op == "watch":
+                        job = self.jobs[request["job_id"]]
+                        streams.add(asyncio.create_task(self.stream(job, writer)))
+                    elif op == "cancel":
+                        cancelled = self.cancel(request["job_id"])
+                        if cancelled:
+                            await send(
+                                writer,
+                                {"event": "cancelled", "job_id": request["job_id"]},
+                            )
+                        else:
+                            await send(
+                                writer,
+                                {
+                                    "event": "error",
+                                    "error": f"job {request['job_id']!r} is not active",
+                                },
+                            )
+                    elif op == "list":
+                        await send(
+                            writer,
+                            {
+                                "event": "jobs",
+                                "jobs": [
+                                    list(job.latest.values())[-1]
+                                    for job in self.jobs.values()
+                                ],
+                            },
+                        )
+                    else:
+                        raise ValueError(f"unknown op {op!r}")
+                except (KeyError, ValueError, TypeError) as error:
+                    await send(writer, {"event": "error", "error": repr(error)})
+        except ConnectionError:
+            pass
+        finally:
+            for task in streams:
+                task.cancel()
+            writer.close()
+
+
+async def send(writer: asyncio.StreamWriter, message: dict) -> None:
+    line = json.dumps(message, ensure_ascii=False, allow_nan=False)
+    writer.write(line.encode() + b"\n")
+    await writer.drain()
+
+
+async def serve(socket_path: str, workers: int) -> None:
+    service = JobService(workers=workers)
+    server = await asyncio.start_unix_server(service.handle_client, path=socket_path)
+    print(f"Serving on {socket_path!r} with {workers} workers.")
+    async with server:
+        await server.serve_forever()
+
+
+async def submit(socket_path: str, job: dict) -> None:
+    """
+    Submits job and prints its events until it is finished.
+    """
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    await send(writer, {"op": "submit", "job": job})
+    while line := await reader.readline():
+        event = json.loads(line)
+        print(json.dumps(event, ensure_ascii=False))
+        if event["event"] in final_events or event["event"] == "error":
+            break
+    writer.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Queue and run autogram searches.")
+    parser.add_argument("--socket", default=default_socket)
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve")
+    serve_parser.add_argument("--workers", type=int, default=os.cpu_count())
+    submit_parser = commands.add_parser("submit")
+    submit_parser.add_argument("job", help='JSON like {"prefix": "This text has "}')
+    arguments = parser.parse_args()
+
+    if arguments.command == "serve":
+        asyncio.run(serve(arguments.socket, arguments.workers))
+    else:
+        asyncio.run(submit(arguments.socket, json.loads(arguments.job)))
@@ -0,0 +1,47 @@
+"""
+numpy helpers shared by the searches that work on count vectors directly.
+"""
+
+import numpy as np
+
+from core import Alphabet, get_contributions, get_fixed_counts
+
+
+def get_window_tables(
+    prefix: str,
+    alphabet: Alphabet,
+    lower_bounds: dict[str, int],
+    upper_bounds: dict[str, int],
+) -> (np.ndarray, list[np.ndarray]):
+    """
+    fixed[j] counts alphabet[j] in the parts of the text that don't depend on counts.
+    tables[i][k, j] is how many alphabet[j] spelling lower_bounds[alphabet[i]] + k
+    alphabet[i]s adds.
+    """
+    fixed_counts = get_fixed_counts(prefix)
+    fixed = np.array([fixed_counts.get(letter, 0) for letter in alphabet], dtype=np.int64)
+
+    contributions = get_contributions(alphabet, lower_bounds, upper_bounds)
+    tables = [
+        np.array(
+            [
+                [contribution.get(other, 0) for other in alphabet]
+                for contribution in contributions[letter].values()
+            ],
+            dtype=np.int64,
+        )
+        for letter in alphabet
+    ]
+    return (fixed, tables)
+
+
+def get_multipliers(size: int) -> np.ndarray:
+    """
+    Fixed random multipliers, so that every process hashes rows the same way.
+    """
+    return np.random.default_rng(0).integers(1, 2**63, size=size, dtype=np.uint64)
+
+
+def hash_rows(rows: np.ndarray, multipliers: np.ndarray) -> np.ndarray:
+    hashed = (rows.astype(np.uint64) * multipliers).sum(axis=1)
+    return hashed ^ (hashed >> np.uint64(31))